@@ -0,0 +1,38 @@
+"""Config access with a compiled-Python cache.
+
+``scripts/compile_configs.py`` converts ``config/*.yaml`` into literal
+modules under ``app/configs/_compiled``; :func:`load` imports those
+(bytecode-cached by the interpreter) and only parses YAML when the cache
+is absent or older than the source file.
+"""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import yaml  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback
+    yaml = None
+
+    from app.util import simple_yaml
+
+CONFIG_DIR = Path("config")
+
+
+def load(name: str) -> Any:
+    """Return the parsed config *name* (e.g. ``"llm"`` for config/llm.yaml)."""
+
+    path = CONFIG_DIR / f"{name}.yaml"
+    try:
+        mod = importlib.import_module(f"app.configs._compiled.{name}")
+        if mod.SOURCE_MTIME >= path.stat().st_mtime:
+            return mod.DATA
+    except Exception:
+        pass
+    text = path.read_text(encoding="utf-8")
+    if yaml is not None:
+        return yaml.safe_load(text)
+    return simple_yaml.loads(text)
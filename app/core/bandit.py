@@ -1,12 +1,10 @@
 from typing import List, Dict
 import random
 
-from app.memory.db import upsert_bandit, get_conn, migrate
+from app.memory.db import upsert_bandit, get_conn
 
 EPS = 0.1
 
-migrate()
-
 def _ctr(intent: str, kind: str) -> float:
     with get_conn() as c:
         cur = c.execute(
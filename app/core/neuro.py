@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any, Dict, Iterable, Tuple, Union
 
@@ -59,12 +60,13 @@ def _ensure_persona_loaded() -> None:
         return
 
     data = _load_yaml(Path("config/persona.yaml")) or {}
-    raw_baseline = data.get("baseline_levels", {}) if isinstance(data, dict) else {}
-    raw_bias_map = data.get("bias_map", {}) if isinstance(data, dict) else {}
-    raw_persona = data.get("persona", {}) if isinstance(data, dict) else {}
+    # Mapping (not dict): simple_yaml hands back read-only mapping proxies.
+    raw_baseline = data.get("baseline_levels", {}) if isinstance(data, Mapping) else {}
+    raw_bias_map = data.get("bias_map", {}) if isinstance(data, Mapping) else {}
+    raw_persona = data.get("persona", {}) if isinstance(data, Mapping) else {}
 
     baseline_items: Iterable[Tuple[str, int]]
-    if isinstance(raw_baseline, dict):
+    if isinstance(raw_baseline, Mapping):
         baseline_items = raw_baseline.items()
     else:
         baseline_items = []
@@ -80,7 +82,7 @@ def _ensure_persona_loaded() -> None:
 
     _LEVELS = dict(_BASELINE)
 
-    if isinstance(raw_bias_map, dict):
+    if isinstance(raw_bias_map, Mapping):
         _STYLE_BASELINE = {
             "humor": float(raw_bias_map.get("humor", 0.0)),
             "structure": float(raw_bias_map.get("structure", 0.0)),
@@ -100,7 +102,7 @@ def _ensure_persona_loaded() -> None:
             "warmth": 0.0,
             "alertness": 0.0,
         }
-    if isinstance(raw_persona, dict):
+    if isinstance(raw_persona, Mapping):
         _PERSONA_META = dict(raw_persona)
     else:
         _PERSONA_META = {}
@@ -1,5 +1,4 @@
 from typing import Dict, Any, List
-from pathlib import Path
 
 from app.memory.db import insert_message, get_last_messages, set_message_meta
 from app.memory.db import get_tool_instructions
@@ -17,21 +16,11 @@ from app.core.budget import trim as pack_budget
 from app.core.tokens import count_struct, count_tokens
 from app.core.logs import log, span
 
-try:  # pragma: no cover - optional dependency
-    import yaml  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - fallback
-    yaml = None
-    from app.util import simple_yaml
+# Prefers the compiled-Python cache (scripts/compile_configs.py) and only
+# parses YAML when that cache is absent or stale.
+from app.configs import load as _load_config
 
-    def _load_yaml(path: Path) -> Dict[str, Any]:
-        return simple_yaml.loads(path.read_text(encoding="utf-8"))
-else:
-
-    def _load_yaml(path: Path) -> Dict[str, Any]:
-        return yaml.safe_load(path.read_text(encoding="utf-8"))
-
-
-_LLM_CFG = _load_yaml(Path("config/llm.yaml"))
+_LLM_CFG = _load_config("llm")
 _SENIOR_MAX_NEW_TOKENS = _LLM_CFG.get("senior", {}).get("max_new_tokens", 512)
 if not isinstance(_SENIOR_MAX_NEW_TOKENS, int) or _SENIOR_MAX_NEW_TOKENS <= 0:
     _SENIOR_MAX_NEW_TOKENS = 512
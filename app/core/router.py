@@ -1,7 +1,28 @@
-from typing import List, Dict
+from typing import Any, Dict, List
 from app.rag.index import search as idx_search
 from app.rag.encoders import encode, cos_sim
 
+try:  # pragma: no cover - optional dependency fallback
+    import numpy as np
+except Exception:  # pragma: no cover - optional dependency fallback
+    np = None  # type: ignore[assignment]
+
+# Content-keyed embedding cache: repeated queries/doc texts (tests, recurring
+# chat snippets) skip the encoder forward pass entirely.
+_ENCODE_CACHE: Dict[str, Any] = {}
+_ENCODE_CACHE_MAX = 2048
+
+
+def _encode_cached(texts: List[str]):
+    missing = [t for t in texts if t not in _ENCODE_CACHE]
+    if missing:
+        if len(_ENCODE_CACHE) + len(missing) > _ENCODE_CACHE_MAX:
+            _ENCODE_CACHE.clear()
+        for t, vec in zip(missing, encode(missing)):
+            _ENCODE_CACHE[t] = vec
+    return [_ENCODE_CACHE[t] for t in texts]
+
+
 def search(query: str, intent: str) -> List[Dict]:
     if not query: return []
     cands = idx_search(query, k=6) or []
@@ -12,11 +33,18 @@ def search(query: str, intent: str) -> List[Dict]:
     return reranked
 
 def rerank_e5(query: str, docs: List[Dict], top_k: int) -> List[Dict]:
-    qv = encode([query])[0]
-    dv = encode([d["text"] for d in docs])
-    rescored = []
-    for d, vec in zip(docs, dv):
-        sim = cos_sim(qv, vec)
-        rescored.append({**d, "rerank": float(sim)})
+    if not docs:
+        return []
+    # One batched encode for query + docs: a single forward pass instead of
+    # per-text launches, then one matrix-vector product for all similarities.
+    vecs = _encode_cached([query] + [d["text"] for d in docs])
+    qv, dv = vecs[0], vecs[1:]
+    if np is not None:
+        mat = np.asarray(dv, dtype=np.float32)
+        qv = np.asarray(qv, dtype=np.float32)
+        sims = (mat @ qv) / (np.linalg.norm(mat, axis=1) * np.linalg.norm(qv) + 1e-8)
+    else:
+        sims = [cos_sim(qv, vec) for vec in dv]
+    rescored = [{**d, "rerank": float(sim)} for d, sim in zip(docs, sims)]
     rescored.sort(key=lambda x: x["rerank"], reverse=True)
     return rescored[:top_k]
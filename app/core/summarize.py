@@ -1,6 +1,12 @@
 from typing import List
 
 
+def init_summarizer() -> None:
+    # Hook for one-time setup (tokenizer/model load) so batch callers can
+    # hoist it out of their per-day loops; the naive summarizer needs none.
+    return None
+
+
 def summarize_day(chunks: List[str], max_tokens: int = 400) -> str:
     # naive summary: first N sentences; replace with LLM summarizer if needed
     text = " ".join(chunks)
@@ -1,6 +1,13 @@
 import importlib
 from typing import List, Dict
 
+# Tools that also ship an aiosqlite-backed coroutine entrypoint.
+_ASYNC_MAPPING = {
+    "note.create": "app.tools.note:main_async",
+    "alias.add": "app.tools.alias:add_async",
+    "alias.set_primary": "app.tools.alias:set_primary_async",
+}
+
 
 def run_all(tool_calls: List[Dict]) -> List[Dict]:
     results = []
@@ -15,6 +22,25 @@ def run_all(tool_calls: List[Dict]) -> List[Dict]:
     return results
 
 
+async def run_all_async(tool_calls: List[Dict]) -> List[Dict]:
+    """Like run_all, but awaits async tool variants instead of blocking."""
+    results = []
+    for call in tool_calls or []:
+        name = call.get("name")
+        args = call.get("args", {})
+        ep = _ASYNC_MAPPING.get(name)
+        if ep:
+            mod_name, func_name = ep.split(":")
+            fn = getattr(importlib.import_module(mod_name), func_name)
+            res = await fn(args)
+        else:
+            mod_name, func_name = _resolve_entrypoint(name)
+            fn = getattr(importlib.import_module(mod_name), func_name)
+            res = fn(args)
+        results.append({"name": name, "result": res})
+    return results
+
+
 def _resolve_entrypoint(name: str) -> tuple[str, str]:
     mapping = {
         "note.create": "app.tools.note:main",
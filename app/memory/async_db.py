@@ -0,0 +1,72 @@
+"""
+Async SQLite access via aiosqlite, sharing one process-wide connection.
+Mirrors app.memory.db for callers that run inside an event loop and must not
+block the thread pool on DB writes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+try:  # pragma: no cover - optional dependency
+    import aiosqlite
+except Exception:  # pragma: no cover - optional dependency
+    aiosqlite = None  # type: ignore[assignment]
+
+from app.memory import db as _db
+
+_ACONN = None
+_ACONN_PATH: Optional[str] = None
+_ACONN_LOCK = asyncio.Lock()
+
+
+async def get_aconn():
+    """Return the shared aiosqlite connection, reopening on DB_PATH change."""
+
+    global _ACONN, _ACONN_PATH
+    if aiosqlite is None:
+        raise RuntimeError("aiosqlite is not installed")
+    path = str(_db.DB_PATH)
+    if _ACONN is None or _ACONN_PATH != path:
+        async with _ACONN_LOCK:
+            if _ACONN is None or _ACONN_PATH != path:
+                conn = await aiosqlite.connect(path)
+                conn.row_factory = aiosqlite.Row
+                for pragma in _db._CONN_PRAGMAS:
+                    await conn.execute(pragma)
+                _ACONN = conn
+                _ACONN_PATH = path
+    return _ACONN
+
+
+async def add_feedback(msg_id: int, kind: str, text: str | None = None) -> int:
+    assert kind in ("up", "down", "text")
+    conn = await get_aconn()
+    cur = await conn.execute(
+        "INSERT INTO feedback(msg_id, kind, text) VALUES (?,?,?)",
+        (msg_id, kind, text),
+    )
+    await conn.commit()
+    return cur.lastrowid
+
+
+async def upsert_bandit(intent: str, kind: str, wins_delta: float, plays_delta: float) -> None:
+    conn = await get_aconn()
+    cur = await conn.execute(
+        "SELECT wins,plays FROM bandit_stats WHERE intent=? AND kind=?", (intent, kind)
+    )
+    row = await cur.fetchone()
+    if row:
+        wins = row["wins"] + wins_delta
+        plays = row["plays"] + plays_delta
+        await conn.execute(
+            "UPDATE bandit_stats SET wins=?, plays=?, updated_at=CURRENT_TIMESTAMP WHERE intent=? AND kind=?",
+            (wins, plays, intent, kind),
+        )
+    else:
+        await conn.execute(
+            "INSERT INTO bandit_stats(intent,kind,wins,plays) VALUES (?,?,?,?)",
+            (intent, kind, max(1.0 + wins_delta, 0.0), max(2.0 + plays_delta, 0.0)),
+        )
+    await conn.commit()
@@ -6,11 +6,59 @@ Provides: get_conn(), migrate(), simple CRUD helpers used by core/* and tools/*.
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Any, Dict, List
 
 DB_PATH = Path("arkestra.db")
 
+_CONN: sqlite3.Connection | None = None
+_CONN_PATH: str | None = None
+_CONN_LOCK = threading.Lock()
+# Serializes transactions on the shared connection: concurrent users (the
+# self-check's thread pool, the async load test) must not interleave
+# statements into each other's in-flight transaction. Re-entrant so nested
+# ``with get_conn()`` blocks in one thread keep working.
+_TX_LOCK = threading.RLock()
+
+
+class _SharedConn:
+    """Transaction-scoped view of the process-wide connection.
+
+    ``with get_conn() as c:`` holds :data:`_TX_LOCK` for the whole block, so
+    each transaction (committed or rolled back on exit) is exclusive to one
+    thread. Attribute access proxies to the underlying connection for
+    one-off statements outside a transaction.
+    """
+
+    __slots__ = ("_conn",)
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        object.__setattr__(self, "_conn", conn)
+
+    def __enter__(self) -> sqlite3.Connection:
+        _TX_LOCK.acquire()
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc_info: Any) -> bool:
+        try:
+            return bool(self._conn.__exit__(*exc_info))
+        finally:
+            _TX_LOCK.release()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._conn, name, value)
+
+_CONN_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=memory",
+    "PRAGMA cache_size=-64000",
+)
+
 SCHEMA_SQL = """
 PRAGMA journal_mode=WAL;
 CREATE TABLE IF NOT EXISTS messages(
@@ -21,6 +69,7 @@ CREATE TABLE IF NOT EXISTS messages(
   ts DATETIME DEFAULT CURRENT_TIMESTAMP,
   approved INTEGER DEFAULT 0
 );
+CREATE INDEX IF NOT EXISTS ix_messages_ts_id ON messages(ts, id);
 CREATE TABLE IF NOT EXISTS facts(
   id INTEGER PRIMARY KEY,
   user_id TEXT, key TEXT, value TEXT,
@@ -39,6 +88,7 @@ CREATE TABLE IF NOT EXISTS aliases(
   ts DATETIME DEFAULT CURRENT_TIMESTAMP,
   UNIQUE(user_id, alias)
 );
+CREATE INDEX IF NOT EXISTS ix_aliases_uid ON aliases(user_id);
 CREATE TABLE IF NOT EXISTS feedback(
   id INTEGER PRIMARY KEY,
   msg_id INTEGER,
@@ -71,7 +121,7 @@ CREATE TABLE IF NOT EXISTS tools(
   title TEXT, description TEXT,
   instruction TEXT, entrypoint TEXT,
   enabled INTEGER DEFAULT 1
-);
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS env_sessions(
   id INTEGER PRIMARY KEY,
   channel TEXT, chat_id TEXT,
@@ -88,6 +138,10 @@ CREATE TABLE IF NOT EXISTS env_facts(
   updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
   FOREIGN KEY(env_id) REFERENCES env_sessions(id)
 );
+-- Covering index: SQLite has no INCLUDE, so key/value ride along in the
+-- composite to serve get_env_facts() entirely from index order.
+CREATE INDEX IF NOT EXISTS ix_env_facts_env_imp_upd
+  ON env_facts(env_id, importance DESC, updated_at DESC, key, value);
 CREATE TABLE IF NOT EXISTS sleep_batches(
   id TEXT PRIMARY KEY,
   started_at DATETIME,
@@ -106,13 +160,38 @@ CREATE TABLE IF NOT EXISTS reminders(
   status TEXT DEFAULT 'scheduled',
   created_at DATETIME DEFAULT CURRENT_TIMESTAMP
 );
+CREATE INDEX IF NOT EXISTS idx_reminders_title ON reminders(title);
 """
 
 
-def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+def get_conn() -> _SharedConn:
+    """Return the shared process-wide connection, reopening on DB_PATH change.
+
+    The result proxies a single underlying connection; use it as a context
+    manager to get an exclusive transaction (see :class:`_SharedConn`).
+    """
+
+    global _CONN, _CONN_PATH
+    path = str(DB_PATH)
+    conn = _CONN
+    if conn is None or _CONN_PATH != path:
+        with _CONN_LOCK:
+            conn = _CONN
+            if conn is None or _CONN_PATH != path:
+                conn = sqlite3.connect(
+                    path,
+                    check_same_thread=False,
+                    cached_statements=256,
+                    # "file:" paths (e.g. shared-cache in-memory DBs used by
+                    # the self-check) need URI parsing enabled.
+                    uri=path.startswith("file:"),
+                )
+                conn.row_factory = sqlite3.Row
+                for pragma in _CONN_PRAGMAS:
+                    conn.execute(pragma)
+                _CONN = conn
+                _CONN_PATH = path
+    return _SharedConn(conn)
 
 
 def migrate() -> None:
@@ -219,10 +298,13 @@ def upsert_env_session(channel: str, chat_id: str, participants_json: str) -> in
         return int(cur.fetchone()["id"])
 
 
+_ENV_FACT_COLS = ("key", "value", "importance")
+
+
 def get_env_facts(env_id: int) -> List[Dict[str, Any]]:
     with get_conn() as c:
         cur = c.execute("SELECT key,value,importance FROM env_facts WHERE env_id=? ORDER BY importance DESC, updated_at DESC", (env_id,))
-        return [dict(r) for r in cur.fetchall()]
+        return [dict(zip(_ENV_FACT_COLS, r)) for r in cur.fetchall()]
 
 
 def set_env_fact(env_id: int, key: str, value: str, importance: float = 0.5) -> None:
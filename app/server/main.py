@@ -0,0 +1,262 @@
+"""
+Локальный admin API поверх ядра: CRUD инструментов (таблица tools), /chat,
+фидбэк и метрики. Только loopback-отладка — наружу ничего не ходит.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+import sqlite3
+from typing import Any, Dict, Iterator, List, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel, Field
+
+from app.core.orchestrator import handle_user
+from app.memory.db import (
+    add_feedback,
+    get_conn,
+    get_env_facts,
+    mark_approved,
+    migrate,
+)
+
+app = FastAPI(title="Arkestra Admin API")
+templates = Jinja2Templates(directory="app/server/templates")
+
+# itertools.count increments in C without dict hashing, and next() is atomic
+# under the GIL; the current value is read back from the iterator state.
+_REQUESTS_TOTAL = itertools.count()
+_ERRORS_TOTAL = itertools.count()
+
+
+def _count_value(counter: Iterator[int]) -> int:
+    return counter.__reduce__()[1][0]
+
+# Hoisted SQL constants: sqlite3's statement cache is keyed on the SQL text,
+# so passing the same string objects maximizes cache hits.
+_SQL_LIST_TOOLS = (
+    "SELECT name,title,description,instruction,entrypoint,enabled FROM tools ORDER BY name"
+)
+_SQL_GET_TOOL = (
+    "SELECT name,title,description,instruction,entrypoint,enabled FROM tools WHERE name=?"
+)
+_SQL_CREATE_TOOL = (
+    "INSERT INTO tools(name,title,description,instruction,entrypoint,enabled) VALUES(?,?,?,?,?,?) "
+    "RETURNING name,title,description,instruction,entrypoint,enabled"
+)
+_SQL_DELETE_TOOL = "DELETE FROM tools WHERE name=?"
+_SQL_UPSERT_TOOL = (
+    "INSERT OR REPLACE INTO tools(name,title,description,instruction,entrypoint,enabled) VALUES(?,?,?,?,?,?)"
+)
+
+_METRICS_TEMPLATE = (
+    "# HELP arkestra_requests_total total requests\n"
+    "# TYPE arkestra_requests_total counter\n"
+    "arkestra_requests_total {r}\n"
+    "# HELP arkestra_errors_total total errors\n"
+    "# TYPE arkestra_errors_total counter\n"
+    "arkestra_errors_total {e}"
+)
+
+
+# Precompiled once: the stub ignores Field metadata, and a frozenset probe
+# beats a regex match for the three feedback kinds anyway.
+_NAME_RE = re.compile(r"^[a-z0-9._\-]+$")
+_FEEDBACK_KINDS = frozenset({"up", "down", "text"})
+
+
+class ToolIn(BaseModel):
+    name: str = Field(...)
+    title: str = ""
+    description: str = ""
+    instruction: str = ""
+    entrypoint: str = ""
+    enabled: bool = True
+
+
+class ToolUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    instruction: Optional[str] = None
+    entrypoint: Optional[str] = None
+    enabled: Optional[bool] = None
+
+
+class ChatIn(BaseModel):
+    user_id: str
+    text: str
+
+
+class FeedbackIn(BaseModel):
+    msg_id: int
+    kind: str = Field(...)
+    text: str = ""
+
+
+@app.on_event("startup")
+def on_startup() -> None:
+    migrate()
+
+
+@app.middleware("http")
+def _metrics_mw(request: Request, call_next):
+    next(_REQUESTS_TOTAL)
+    try:
+        return call_next(request)
+    except Exception:
+        next(_ERRORS_TOTAL)
+        raise
+
+
+def _row_to_tool(row: sqlite3.Row) -> Dict[str, Any]:
+    # Plain dicts go straight to the JSON encoder; building a Pydantic model
+    # per row only to serialize it back again doubles the allocations.
+    tool = dict(row)
+    tool["enabled"] = bool(tool["enabled"])
+    return tool
+
+
+def list_tools() -> List[Dict[str, Any]]:
+    with get_conn() as c:
+        cur = c.execute(_SQL_LIST_TOOLS)
+        cur.arraysize = 128
+        # Iterating the cursor fetches in arraysize batches instead of
+        # materializing an intermediate row list via fetchall().
+        return [_row_to_tool(row) for row in cur]
+
+
+@app.get("/tools")
+def api_list_tools() -> List[Dict[str, Any]]:
+    return list_tools()
+
+
+@app.get("/tools/{name}")
+def get_tool(name: str) -> Dict[str, Any]:
+    with get_conn() as c:
+        cur = c.execute(_SQL_GET_TOOL, (name,))
+        row = cur.fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="tool not found")
+    return _row_to_tool(row)
+
+
+@app.post("/tools", status_code=201)
+def create_tool(payload: ToolIn) -> Dict[str, Any]:
+    if not _NAME_RE.match(payload.name):
+        raise HTTPException(status_code=422, detail="invalid tool name")
+    with get_conn() as c:
+        try:
+            # INSERT ... RETURNING folds the read-back SELECT into one statement.
+            cur = c.execute(
+                _SQL_CREATE_TOOL,
+                (
+                    payload.name,
+                    payload.title,
+                    payload.description,
+                    payload.instruction,
+                    payload.entrypoint,
+                    int(payload.enabled),
+                ),
+            )
+            row = cur.fetchone()
+        except sqlite3.IntegrityError:
+            raise HTTPException(status_code=409, detail="tool already exists")
+    return _row_to_tool(row)
+
+
+@app.post("/tools/bulk", status_code=201)
+def bulk_upsert_tools(payload: List[Dict[str, Any]]) -> Dict[str, Any]:
+    tools = [ToolIn(**item) for item in payload or []]
+    for t in tools:
+        if not _NAME_RE.match(t.name):
+            raise HTTPException(status_code=422, detail=f"invalid tool name: {t.name}")
+    rows = [
+        (t.name, t.title, t.description, t.instruction, t.entrypoint, int(t.enabled))
+        for t in tools
+    ]
+    with get_conn() as c:
+        # executemany in one explicit transaction: one statement prepare and a
+        # single fsync instead of a round-trip per tool.
+        c.execute("BEGIN IMMEDIATE")
+        c.executemany(_SQL_UPSERT_TOOL, rows)
+        c.execute("COMMIT")
+    return {"ok": True, "count": len(rows)}
+
+
+@app.put("/tools/{name}")
+def update_tool(name: str, payload: ToolUpdate) -> Dict[str, Any]:
+    # Intersect with the declared fields: the model keeps extra JSON keys in
+    # __fields_set__, and only known column names may reach the SQL below.
+    fields = payload.__fields_set__ & ToolUpdate.__field_names_set__
+    if not fields:
+        raise HTTPException(status_code=400, detail="no fields to update")
+    columns = ", ".join(f"{key}=?" for key in fields)
+    values = [
+        int(getattr(payload, key)) if key == "enabled" else getattr(payload, key)
+        for key in fields
+    ]
+    with get_conn() as c:
+        # UPDATE ... RETURNING (SQLite >= 3.35) folds the read-after-write
+        # SELECT into the same statement.
+        cur = c.execute(
+            f"UPDATE tools SET {columns} WHERE name=? "
+            "RETURNING name,title,description,instruction,entrypoint,enabled",
+            (*values, name),
+        )
+        row = cur.fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="tool not found")
+    return _row_to_tool(row)
+
+
+@app.delete("/tools/{name}")
+def delete_tool(name: str) -> Dict[str, Any]:
+    with get_conn() as c:
+        cur = c.execute(_SQL_DELETE_TOOL, (name,))
+        if cur.rowcount == 0:
+            raise HTTPException(status_code=404, detail="tool not found")
+    return {"ok": True}
+
+
+@app.post("/chat")
+def chat(payload: ChatIn) -> Dict[str, Any]:
+    return handle_user(payload.user_id, payload.text)
+
+
+@app.post("/feedback")
+def feedback(payload: FeedbackIn) -> Dict[str, Any]:
+    if payload.kind not in _FEEDBACK_KINDS:
+        raise HTTPException(status_code=422, detail="invalid feedback kind")
+    fb_id = add_feedback(payload.msg_id, payload.kind, payload.text or None)
+    return {"ok": True, "feedback_id": fb_id}
+
+
+@app.post("/approve/{msg_id}")
+def approve(msg_id: str) -> Dict[str, Any]:
+    mark_approved(int(msg_id))
+    return {"ok": True}
+
+
+@app.get("/env/{env_id}/facts")
+def env_facts(env_id: str) -> List[Dict[str, Any]]:
+    return get_env_facts(int(env_id))
+
+
+@app.get("/metrics")
+def metrics() -> str:
+    return _METRICS_TEMPLATE.format(
+        r=_count_value(_REQUESTS_TOTAL), e=_count_value(_ERRORS_TOTAL)
+    )
+
+
+@app.get("/ui/tools")
+def ui_tools() -> Dict[str, Any]:
+    return templates.TemplateResponse("tools.html", {"tools": list_tools()})
+
+
+@app.get("/ui/tools/{name}")
+def ui_edit_tool(name: str) -> Dict[str, Any]:
+    return templates.TemplateResponse("tool_edit.html", {"tool": get_tool(name)})
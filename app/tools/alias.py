@@ -7,6 +7,11 @@ from typing import Dict
 
 from app.memory.db import get_conn
 
+_SQL_ADD_ALIAS = "INSERT INTO aliases(user_id,alias,short_desc,is_primary) VALUES (?,?,?,0)"
+_SQL_SET_PRIMARY = (
+    "UPDATE aliases SET is_primary = CASE WHEN alias=? THEN 1 ELSE 0 END WHERE user_id=?"
+)
+
 
 def add(args: Dict) -> Dict:
     user_id = args.get("user_id", "self")
@@ -16,26 +21,53 @@ def add(args: Dict) -> Dict:
         return {"ok": False, "error": "alias required"}
     with get_conn() as c:
         try:
-            c.execute(
-                "INSERT INTO aliases(user_id,alias,short_desc,is_primary) VALUES (?,?,?,0)",
-                (user_id, alias, short_desc),
-            )
+            c.execute(_SQL_ADD_ALIAS, (user_id, alias, short_desc))
         except Exception as e:  # pragma: no cover - sqlite3 errors vary
             return {"ok": False, "error": str(e)}
     return {"ok": True, "alias": alias}
 
 
+async def add_async(args: Dict) -> Dict:
+    """Async variant of :func:`add` for event-loop callers (aiosqlite)."""
+    from app.memory.async_db import get_aconn
+
+    user_id = args.get("user_id", "self")
+    alias = (args.get("alias") or "").strip()
+    short_desc = (args.get("short_desc") or "").strip()
+    if not alias:
+        return {"ok": False, "error": "alias required"}
+    conn = await get_aconn()
+    try:
+        await conn.execute(_SQL_ADD_ALIAS, (user_id, alias, short_desc))
+        await conn.commit()
+    except Exception as e:  # pragma: no cover - sqlite3 errors vary
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "alias": alias}
+
+
 def set_primary(args: Dict) -> Dict:
     user_id = args.get("user_id", "self")
     alias = (args.get("alias") or "").strip()
     if not alias:
         return {"ok": False, "error": "alias required"}
     with get_conn() as conn:
-        cur = conn.execute("UPDATE aliases SET is_primary=0 WHERE user_id=?", (user_id,))
-        cur = conn.execute(
-            "UPDATE aliases SET is_primary=1 WHERE user_id=? AND alias=?",
-            (user_id, alias),
-        )
+        # Один UPDATE CASE WHEN вместо пары «обнулить все» + «поднять один»:
+        # атомарно и за один проход по индексу.
+        cur = conn.execute(_SQL_SET_PRIMARY, (alias, user_id))
         updated = cur.rowcount
-        conn.commit()
+    return {"ok": bool(updated), "updated": int(updated)}
+
+
+async def set_primary_async(args: Dict) -> Dict:
+    """Async variant of :func:`set_primary` for event-loop callers (aiosqlite)."""
+    from app.memory.async_db import get_aconn
+
+    user_id = args.get("user_id", "self")
+    alias = (args.get("alias") or "").strip()
+    if not alias:
+        return {"ok": False, "error": "alias required"}
+    conn = await get_aconn()
+    cur = await conn.execute(_SQL_SET_PRIMARY, (alias, user_id))
+    await conn.commit()
+    updated = cur.rowcount
     return {"ok": bool(updated), "updated": int(updated)}
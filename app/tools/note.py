@@ -6,6 +6,8 @@ from typing import Any, Dict
 
 from app.memory.db import get_conn
 
+_SQL_INSERT_NOTE = "INSERT INTO notes(user_id, text, tags) VALUES (?,?,?)"
+
 
 def main(args: Dict[str, Any] | None) -> Dict[str, Any]:
     """Create a note entry in the database.
@@ -19,23 +21,43 @@ def main(args: Dict[str, Any] | None) -> Dict[str, Any]:
         ``note_id`` of the created note; otherwise an ``error`` message.
     """
 
-    payload = args or {}
-    text = str(payload.get("text", "")).strip()
-    tags_value = payload.get("tags", [])
+    text, tags = _parse_args(args)
 
     if not text:
         return {"ok": False, "error": "text is required"}
 
+    with get_conn() as conn:
+        cursor = conn.execute(_SQL_INSERT_NOTE, ("self", text, tags))
+        note_id = cursor.lastrowid
+
+    return {"ok": True, "note_id": note_id}
+
+
+async def main_async(args: Dict[str, Any] | None) -> Dict[str, Any]:
+    """Async variant of :func:`main` for event-loop callers (aiosqlite)."""
+
+    from app.memory.async_db import get_aconn
+
+    text, tags = _parse_args(args)
+
+    if not text:
+        return {"ok": False, "error": "text is required"}
+
+    conn = await get_aconn()
+    cursor = await conn.execute(_SQL_INSERT_NOTE, ("self", text, tags))
+    await conn.commit()
+
+    return {"ok": True, "note_id": cursor.lastrowid}
+
+
+def _parse_args(args: Dict[str, Any] | None) -> tuple[str, str]:
+    payload = args or {}
+    text = str(payload.get("text", "")).strip()
+    tags_value = payload.get("tags", [])
+
     if isinstance(tags_value, list):
         tags = ",".join(str(tag) for tag in tags_value)
     else:
         tags = str(tags_value)
 
-    with get_conn() as conn:
-        cursor = conn.execute(
-            "INSERT INTO notes(user_id, text, tags) VALUES (?,?,?)",
-            ("self", text, tags),
-        )
-        note_id = cursor.lastrowid
-
-    return {"ok": True, "note_id": note_id}
+    return text, tags
@@ -3,20 +3,31 @@
 from __future__ import annotations
 
 import datetime as dt
+import re
 from typing import Dict
 
 import pytz
-from dateutil import parser as dp
 
 from app.core.reminders import create_reminder
 
+# Fast path for the common ISO shapes; dateutil's fuzzy parser is ~50x slower
+# and only gets imported when the regex misses.
+_ISO_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2})(?::(\d{2}))?$")
+_LOCAL_TZ = pytz.timezone("Europe/Amsterdam")
+_UTC = pytz.UTC
+
 
 def _to_utc(dt_str: str) -> dt.datetime:
-    parsed = dp.parse(dt_str)
+    m = _ISO_RE.match(dt_str)
+    if m:
+        parsed = dt.datetime(*map(int, m.groups(default="0")))
+    else:
+        from dateutil import parser as dp
+
+        parsed = dp.parse(dt_str)
     if parsed.tzinfo is None:
-        tz = pytz.timezone("Europe/Amsterdam")
-        parsed = tz.localize(parsed)
-    return parsed.astimezone(pytz.UTC)
+        parsed = _LOCAL_TZ.localize(parsed)
+    return parsed.astimezone(_UTC)
 
 
 def main(args: Dict) -> Dict:
@@ -7,6 +7,11 @@ from typing import Any, Dict
 
 from app.memory.db import get_conn
 
+_SQL_SEARCH_BY_TS = "SELECT role,text,ts FROM messages WHERE ts>=? AND ts<? ORDER BY id"
+
+# Frozen column tuple: every row dict shares the same interned key strings.
+_COLS = ("role", "text", "ts")
+
 
 def main(args: Dict[str, Any] | None) -> Dict[str, Any]:
     """Fetch messages stored within the provided date range."""
@@ -27,11 +32,13 @@ def main(args: Dict[str, Any] | None) -> Dict[str, Any]:
     end_dt = start_dt + timedelta(days=max(span, 1))
     end = end_dt.strftime("%Y-%m-%d 00:00:00")
 
+    rows: list[Dict[str, Any]] = []
     with get_conn() as conn:
-        cursor = conn.execute(
-            "SELECT role,text,ts FROM messages WHERE ts>=? AND ts<? ORDER BY id",
-            (start, end),
-        )
-        rows = [dict(row) for row in cursor.fetchall()]
+        cursor = conn.execute(_SQL_SEARCH_BY_TS, (start, end))
+        while True:
+            batch = cursor.fetchmany(512)
+            if not batch:
+                break
+            rows.extend(dict(zip(_COLS, row)) for row in batch)
 
     return {"ok": True, "items": rows, "count": len(rows)}
@@ -0,0 +1,256 @@
+"""Lightweight subset of FastAPI used in tests."""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency fallback
+    from pydantic import BaseModel
+except Exception:  # pragma: no cover - optional dependency fallback
+    BaseModel = None  # type: ignore[assignment]
+
+
+class HTTPException(Exception):
+    def __init__(self, status_code: int, detail: str = "") -> None:
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class Request:
+    """Bare request descriptor passed to middlewares."""
+
+    def __init__(self, method: str, path: str) -> None:
+        self.method = method
+        self.path = path
+
+
+# Dict hit avoids the .upper() call (and its string allocation) for the
+# method names every client actually sends.
+_METHOD_INTERNED = {
+    m: sys.intern(m)
+    for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+}
+
+
+def _normalize_method(method: str) -> str:
+    return _METHOD_INTERNED.get(method) or sys.intern(method.upper())
+
+
+# Handler shapes, classified once at registration so dispatch compares an
+# int instead of re-running isinstance/issubclass per request.
+_SINGLE_MODEL, _SINGLE_SCALAR, _MULTI_KW, _NO_PARAMS = range(4)
+
+
+@dataclass(slots=True)
+class SigInfo:
+    """Pre-resolved handler parameters: (name, annotation, is_basemodel)."""
+
+    params: Tuple[Tuple[str, Any, bool], ...]
+    kind: int
+    name: Optional[str]
+    model_cls: Optional[type]
+    multi_names: Tuple[str, ...]
+
+
+# WeakKeyDictionary so dynamically created handlers (lambdas, partials in
+# tests) are not pinned alive by the cache.
+_SIGNATURE_CACHE: "weakref.WeakKeyDictionary[Callable, SigInfo]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _sig_for(func: Callable) -> SigInfo:
+    info = _SIGNATURE_CACHE.get(func)
+    if info is None:
+        handler_globals = getattr(func, "__globals__", {})
+        params = []
+        for p in inspect.signature(func).parameters.values():
+            if p.kind not in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY):
+                continue
+            annotation = p.annotation
+            if isinstance(annotation, str):
+                annotation = handler_globals.get(annotation, annotation)
+            is_basemodel = (
+                BaseModel is not None
+                and isinstance(annotation, type)
+                and issubclass(annotation, BaseModel)
+            )
+            params.append((p.name, annotation, is_basemodel))
+        if not params:
+            kind, name, model_cls = _NO_PARAMS, None, None
+        elif len(params) == 1:
+            name, annotation, is_basemodel = params[0]
+            kind = _SINGLE_MODEL if is_basemodel else _SINGLE_SCALAR
+            model_cls = annotation if is_basemodel else None
+        else:
+            kind, name, model_cls = _MULTI_KW, None, None
+        info = SigInfo(
+            params=tuple(params),
+            kind=kind,
+            name=name,
+            model_cls=model_cls,
+            multi_names=tuple(p[0] for p in params),
+        )
+        _SIGNATURE_CACHE[func] = info
+    return info
+
+
+def _inject_json(handler: Callable, json_payload: Any, kwargs: Dict[str, Any]) -> None:
+    info = _sig_for(handler)
+    if not kwargs:
+        # No path params consumed anything: use the precomputed shape.
+        kind = info.kind
+        if kind == _SINGLE_MODEL and isinstance(json_payload, dict):
+            kwargs[info.name] = info.model_cls(**json_payload)
+            return
+        if kind == _SINGLE_SCALAR:
+            kwargs[info.name] = json_payload
+            return
+        if kind == _MULTI_KW and isinstance(json_payload, dict):
+            # kwargs is empty here, so no per-name membership checks needed.
+            kwargs.update(
+                (name, json_payload[name])
+                for name in info.multi_names
+                if name in json_payload
+            )
+            return
+        if kind == _NO_PARAMS:
+            return
+    params = [p for p in info.params if p[0] not in kwargs]
+    if len(params) == 1:
+        name, annotation, is_basemodel = params[0]
+        if is_basemodel and isinstance(json_payload, dict):
+            kwargs[name] = annotation(**json_payload)
+        else:
+            kwargs[name] = json_payload
+    elif isinstance(json_payload, dict):
+        for name, _annotation, _is_basemodel in params:
+            if name in json_payload:
+                kwargs[name] = json_payload[name]
+
+
+def _serialize(value: Any) -> Any:
+    if BaseModel is not None and isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, list):
+        return [_serialize(item) for item in value]
+    return value
+
+
+class FastAPI:
+    """Very small FastAPI implementation: exact-match routing + JSON kwargs."""
+
+    def __init__(self, title: str = "", **_kwargs: Any) -> None:
+        self.title = title
+        # Per-method sub-dicts: path lookup hashes one string instead of
+        # allocating and hashing a (method, path) tuple per request.
+        self._routes_by_method: Dict[str, Dict[str, Tuple[Callable, int]]] = {}
+        self._middlewares: List[Callable] = []
+        self._event_handlers: Dict[str, List[Callable]] = {}
+
+    def on_event(self, event: str) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            self._event_handlers.setdefault(event, []).append(func)
+            return func
+
+        return decorator
+
+    def middleware(self, _kind: str) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            self._middlewares.append(func)
+            return func
+
+        return decorator
+
+    def get(self, path: str, status_code: int = 200) -> Callable:
+        return self._add_route("GET", path, status_code)
+
+    def post(self, path: str, status_code: int = 200) -> Callable:
+        return self._add_route("POST", path, status_code)
+
+    def put(self, path: str, status_code: int = 200) -> Callable:
+        return self._add_route("PUT", path, status_code)
+
+    def delete(self, path: str, status_code: int = 200) -> Callable:
+        return self._add_route("DELETE", path, status_code)
+
+    def _add_route(self, method: str, path: str, status_code: int) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            self._register(method, path, func, status_code)
+            return func
+
+        return decorator
+
+    def _register(self, method: str, path: str, func: Callable, status_code: int) -> None:
+        # Resolve the handler signature once here instead of per request:
+        # inspect.signature dominates dispatch time for these tiny handlers.
+        _sig_for(func)
+        by_path = self._routes_by_method.setdefault(_normalize_method(method), {})
+        # Interned paths let dict lookups short-circuit on pointer equality.
+        by_path[sys.intern(path)] = (func, status_code)
+
+    def _match(self, method: str, path: str) -> Tuple[Optional[Tuple[Callable, int]], Dict[str, str]]:
+        by_path = self._routes_by_method.get(method)
+        if by_path is None:
+            return None, {}
+        entry = by_path.get(path)
+        if entry is not None:
+            return entry, {}
+        segments = path.split("/")
+        for pattern, candidate in by_path.items():
+            if "{" not in pattern:
+                continue
+            pattern_segments = pattern.split("/")
+            if len(pattern_segments) != len(segments):
+                continue
+            params: Dict[str, str] = {}
+            for expected, actual in zip(pattern_segments, segments):
+                if expected.startswith("{") and expected.endswith("}"):
+                    params[expected[1:-1]] = actual
+                elif expected != actual:
+                    break
+            else:
+                return candidate, params
+        return None, {}
+
+    def _dispatch(self, method: str, path: str, **kwargs: Any) -> Tuple[int, Any]:
+        method = _normalize_method(method)
+        entry, path_params = self._match(method, path)
+        if entry is None:
+            return 404, {"detail": "Not Found"}
+        handler, status_code = entry
+        kwargs.update(path_params)
+
+        # Early branch: the common GET path pays one membership test instead
+        # of a dict.pop plus the whole injection block.
+        if "json" in kwargs:
+            _inject_json(handler, kwargs.pop("json"), kwargs)
+
+        request = Request(method, path)
+
+        def call(_request: Request) -> Any:
+            return handler(**kwargs)
+
+        for mw in reversed(self._middlewares):
+            call = _bind_middleware(mw, call)
+
+        try:
+            result = call(request)
+        except HTTPException as exc:
+            return exc.status_code, {"detail": exc.detail}
+        return status_code, _serialize(result)
+
+
+def _bind_middleware(mw: Callable, call_next: Callable) -> Callable:
+    def wrapped(request: Request) -> Any:
+        return mw(request, call_next)
+
+    return wrapped
+
+
+__all__ = ["FastAPI", "HTTPException", "Request"]
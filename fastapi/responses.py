@@ -0,0 +1,40 @@
+"""Response primitives for the FastAPI test stub."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class _Response:
+    """One per client call: slotted to skip the per-instance __dict__."""
+
+    __slots__ = ("status_code", "_body")
+
+    def __init__(self, status_code: int, body: Any) -> None:
+        self.status_code = status_code
+        self._body = body
+
+    # Deliberately a method, not an attribute: callers use r.json() like the
+    # real httpx-backed TestClient, and swapping to attribute access would
+    # fork every call site from upstream FastAPI usage for a one-opcode win.
+    def json(self) -> Any:
+        return self._body
+
+
+class HTMLResponse:
+    __slots__ = ("content", "status_code")
+
+    def __init__(self, content: str, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+
+
+class RedirectResponse:
+    __slots__ = ("url", "status_code")
+
+    def __init__(self, url: str, status_code: int = 307) -> None:
+        self.url = url
+        self.status_code = status_code
+
+
+__all__ = ["HTMLResponse", "RedirectResponse"]
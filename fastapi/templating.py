@@ -0,0 +1,37 @@
+"""Template helpers for the FastAPI test stub."""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, FrozenSet
+
+
+class Jinja2Templates:
+    """Returns template name + context instead of rendering HTML."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        # "Precompile" analogue: scan the template dir once at startup so
+        # unknown names fail fast instead of being stat'ed per response.
+        self._known: FrozenSet[str] = frozenset(self._scan(directory))
+
+    @staticmethod
+    def _scan(directory: str) -> list:
+        names = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        names.append(entry.name)
+        except OSError:
+            pass
+        return names
+
+    def TemplateResponse(self, name: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        if self._known and name not in self._known:
+            raise LookupError(f"template not found: {name}")
+        # Single DICT_MERGE: allocated at final size, no resize from update().
+        return {"template": name, **context}
+
+
+__all__ = ["Jinja2Templates"]
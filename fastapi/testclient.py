@@ -0,0 +1,50 @@
+"""Synchronous test client for the FastAPI stub.
+
+Unlike the real Starlette TestClient there is no anyio sync-over-async
+bridge here: requests are plain function calls into the app's dispatch
+table, so an httpx.AsyncClient/ASGITransport rewrite would add an event
+loop where none exists today. Revisit only if the stub grows async
+handlers.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from fastapi.responses import _Response
+
+
+class TestClient:
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        # Bound once: saves a LOAD_ATTR per request on the hot path.
+        self._dispatch = app._dispatch
+        for func in app._event_handlers.get("startup", []):
+            func()
+
+    def __enter__(self) -> "TestClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        for func in self.app._event_handlers.get("shutdown", []):
+            func()
+
+    def get(self, path: str, **kwargs: Any) -> _Response:
+        return self._request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs: Any) -> _Response:
+        return self._request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs: Any) -> _Response:
+        return self._request("PUT", path, **kwargs)
+
+    def delete(self, path: str, **kwargs: Any) -> _Response:
+        return self._request("DELETE", path, **kwargs)
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> _Response:
+        status_code, body = self._dispatch(method, sys.intern(path), **kwargs)
+        return _Response(status_code, body)
+
+
+__all__ = ["TestClient"]
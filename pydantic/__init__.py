@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Set
+from typing import Any, Dict, FrozenSet, Set, Tuple
 
 
 def Field(default: Any = ..., **_kwargs: Any) -> Any:
@@ -11,37 +11,101 @@ def Field(default: Any = ..., **_kwargs: Any) -> Any:
     return default
 
 
+def _compile_init(cls: type) -> Any:
+    """Generate an unrolled ``__init__`` for *cls* (the attrs/pydantic-core trick).
+
+    One straight-line bytecode sequence per field instead of a generic loop.
+    """
+
+    ns: Dict[str, Any] = {
+        "_setattr": object.__setattr__,
+        "_fields": cls.__field_names_set__,
+    }
+    lines = [
+        "def __init__(self, **data):",
+        "    _s = _setattr",
+        "    _f = set()",
+        "    _s(self, '__fields_set__', _f)",
+        "    _add = _f.add",
+    ]
+    for i, (name, default) in enumerate(cls.__field_items__):
+        lines += [
+            f"    if {name!r} in data:",
+            f"        _s(self, {name!r}, data[{name!r}]); _add({name!r})",
+            "    else:",
+        ]
+        if default is ...:
+            lines.append(f"        raise TypeError('Missing required field: {name}')")
+        else:
+            ns[f"_d{i}"] = default
+            lines.append(f"        _s(self, {name!r}, _d{i})")
+    lines += [
+        "    if len(data) > len(_f):",
+        "        _s(self, '_has_extras', True)",
+        "        for extra, value in data.items():",
+        "            if extra not in _fields:",
+        "                _s(self, extra, value); _add(extra)",
+    ]
+    exec("\n".join(lines), ns)
+    return ns["__init__"]
+
+
 class BaseModel:
     """Very small BaseModel implementation."""
 
+    # Field order and defaults are frozen per subclass at class-creation
+    # time so __init__/dict() never re-walk __annotations__.
+    __field_items__: Tuple[Tuple[str, Any], ...] = ()
+    __field_names_set__: FrozenSet[str] = frozenset()
+    # Flipped per instance only when extra keys were passed; lets dict()
+    # skip scanning __dict__ in the common no-extras case.
+    _has_extras = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        annotations = cls.__dict__.get("__annotations__", {})
+        cls.__field_items__ = tuple(
+            (name, getattr(cls, name, ...)) for name in annotations
+        )
+        cls.__field_names_set__ = frozenset(annotations)
+        cls.__init__ = _compile_init(cls)  # type: ignore[method-assign]
+
     def __init__(self, **data: Any) -> None:
-        annotations = getattr(self, "__annotations__", {})
-        self.__fields_set__: Set[str] = set()
+        # Local aliases keep the hot loop on LOAD_FAST; object.__setattr__
+        # sidesteps the descriptor protocol per assignment.
+        _setattr = object.__setattr__
+        fields_set: Set[str] = set()
+        _setattr(self, "__fields_set__", fields_set)
+        data_get = data.get
+        add = fields_set.add
 
-        for name in annotations:
-            if name in data:
-                value = data[name]
-                self.__fields_set__.add(name)
-            else:
-                value = getattr(self.__class__, name, ...)
+        for name, default in type(self).__field_items__:
+            value = data_get(name, default)
             if value is ...:
                 raise TypeError(f"Missing required field: {name}")
-            setattr(self, name, value)
+            _setattr(self, name, value)
+            if name in data:
+                add(name)
 
-        for extra, value in data.items():
-            if extra not in annotations:
-                setattr(self, extra, value)
-                self.__fields_set__.add(extra)
+        if len(data) > len(fields_set):
+            _setattr(self, "_has_extras", True)
+            field_names = type(self).__field_names_set__
+            for extra, value in data.items():
+                if extra not in field_names:
+                    _setattr(self, extra, value)
+                    add(extra)
 
     def dict(self, *, exclude_unset: bool = False) -> Dict[str, Any]:
-        annotations = getattr(self, "__annotations__", {})
         result: Dict[str, Any] = {}
-        for name in annotations:
+        for name, _default in type(self).__field_items__:
             if exclude_unset and name not in self.__fields_set__:
                 continue
             result[name] = getattr(self, name)
+        if not self._has_extras:
+            return result
+        field_names = type(self).__field_names_set__
         for name in getattr(self, "__dict__", {}):
-            if name not in annotations:
+            if name not in field_names and name not in ("__fields_set__", "_has_extras"):
                 if exclude_unset and name not in self.__fields_set__:
                     continue
                 result[name] = getattr(self, name)
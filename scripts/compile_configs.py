@@ -0,0 +1,64 @@
+"""Compile config/*.yaml into importable Python literal modules.
+
+Parsing YAML on every startup costs far more than importing cached
+bytecode; this build step writes ``app/configs/_compiled/<name>.py`` with
+the parsed document as a literal, which ``app.configs.load()`` prefers
+while the source file is unchanged.
+"""
+
+from pathlib import Path
+from pprint import pformat
+
+try:  # pragma: no cover - optional dependency
+    import yaml  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - fallback
+    yaml = None
+
+from app.util import simple_yaml
+
+CONFIG_DIR = Path("config")
+OUT_DIR = Path("app") / "configs" / "_compiled"
+
+
+def _plain(obj):
+    """Unfreeze parser output into literal-friendly dicts and lists."""
+
+    if hasattr(obj, "items"):
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain(v) for v in obj]
+    return obj
+
+
+def compile_configs() -> int:
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    (OUT_DIR / "__init__.py").write_text(
+        '"""Generated by scripts/compile_configs.py; do not edit."""\n',
+        encoding="utf-8",
+    )
+    count = 0
+    for src in sorted(CONFIG_DIR.glob("*.yaml")):
+        text = src.read_text(encoding="utf-8")
+        try:
+            if yaml is not None:
+                data = _plain(yaml.safe_load(text))
+            else:
+                data = _plain(simple_yaml.loads(text))
+        except Exception as exc:
+            # e.g. config/router.yaml is not strictly valid YAML; leave such
+            # files to whatever parser their consumer already uses.
+            print(f"Skipping {src}: {exc.__class__.__name__}")
+            continue
+        module_text = (
+            '"""Generated by scripts/compile_configs.py; do not edit."""\n\n'
+            f"SOURCE_MTIME = {src.stat().st_mtime!r}\n\n"
+            f"DATA = {pformat(data, sort_dicts=False)}\n"
+        )
+        (OUT_DIR / f"{src.stem}.py").write_text(module_text, encoding="utf-8")
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    n = compile_configs()
+    print(f"Compiled {n} configs into {OUT_DIR}")
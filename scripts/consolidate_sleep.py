@@ -3,10 +3,10 @@ Processes ALL unconsolidated records since last batch, groups by day, writes tem
 pushes aged temp -> long, updates RAG corpora (replace with real indices), resets neuro, and prepares SFT/LoRA sets.
 """
 
-from typing import List, Dict
+from typing import Dict
 from datetime import datetime, timedelta
 from app.core import neuro
-from app.core.summarize import summarize_day
+from app.core.summarize import init_summarizer, summarize_day
 from app.memory.db import get_conn
 
 from scripts.export_sft import export_sft
@@ -31,14 +31,17 @@ def run_sleep_batch():
         to_seen = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         batch_id = f"batch-{to_seen}"
 
-        # collect unconsolidated messages/notes/facts since last watermark
-        cur = c.execute("SELECT id, text, ts FROM messages WHERE ts > ? ORDER BY ts ASC", (from_seen,))
-        msgs = [dict(r) for r in cur.fetchall()]
-        # bucket by date (UTC date from ts)
-        buckets: Dict[str, List[str]] = {}
-        for m in msgs:
-            day = m["ts"][:10]
-            buckets.setdefault(day, []).append(m["text"])
+        # bucket by day inside SQLite: the group-by runs in C and Python only
+        # sees one row per day instead of one dict per message. The ordered
+        # subquery pins GROUP_CONCAT to ts order (unspecified otherwise), so
+        # summaries see each day's messages chronologically.
+        cur = c.execute(
+            "SELECT day, GROUP_CONCAT(text, char(10)) AS texts, COUNT(*) AS n "
+            "FROM (SELECT substr(ts,1,10) AS day, text FROM messages WHERE ts > ? ORDER BY ts) "
+            "GROUP BY day ORDER BY day",
+            (from_seen,),
+        )
+        day_rows = cur.fetchall()
 
         processed = 0
         # temp store: create tables if not exist
@@ -47,22 +50,24 @@ def run_sleep_batch():
         CREATE TABLE IF NOT EXISTS facts_curated(id INTEGER PRIMARY KEY, key TEXT, value TEXT, first_seen TEXT, last_seen TEXT, importance REAL DEFAULT 0.5, batch_id TEXT);
         CREATE TABLE IF NOT EXISTS long_days(id INTEGER PRIMARY KEY, date TEXT, summary TEXT, key_events TEXT);
         """)
-        # write summaries
-        for day, chunks in buckets.items():
-            if not chunks:
+        # write summaries: collect tuples, bind them all in one executemany
+        init_summarizer()  # loop-invariant setup hoisted out of the per-day calls
+        summary_rows = []
+        for day, texts, n in day_rows:
+            if not texts:
                 continue
-            summary = summarize_day(chunks, max_tokens=400)
-            c.execute("INSERT INTO day_summaries(date,text,salience,batch_id) VALUES (?,?,?,?)", (day, summary, 0.6, batch_id))
-            processed += len(chunks)
+            summary_rows.append((day, summarize_day(texts.split("\n"), max_tokens=400), 0.6, batch_id))
+            processed += n
+        c.executemany("INSERT INTO day_summaries(date,text,salience,batch_id) VALUES (?,?,?,?)", summary_rows)
 
         # temp TTL -> long (7 days)
         ttl_day = (datetime.utcnow()-timedelta(days=7)).strftime("%Y-%m-%d")
         cur = c.execute("SELECT date, GROUP_CONCAT(text,' ') AS all_text FROM day_summaries WHERE date <= ? GROUP BY date", (ttl_day,))
-        to_promote = [dict(r) for r in cur.fetchall()]
-        for row in to_promote:
-            c.execute("INSERT OR REPLACE INTO long_days(date, summary, key_events) VALUES (?,?,?)", (row["date"], row["all_text"][:2000], "[]"))
-            # (Optional) delete promoted rows from day_summaries
-            c.execute("DELETE FROM day_summaries WHERE date = ?", (row["date"],))
+        promote_rows = [(r["date"], r["all_text"][:2000], "[]") for r in cur.fetchall()]
+        if promote_rows:
+            c.executemany("INSERT OR REPLACE INTO long_days(date, summary, key_events) VALUES (?,?,?)", promote_rows)
+            qmarks = ",".join("?" for _ in promote_rows)
+            c.execute(f"DELETE FROM day_summaries WHERE date IN ({qmarks})", [r[0] for r in promote_rows])
 
         # write batch
         c.execute("INSERT INTO sleep_batches(id,started_at,finished_at,from_seen_at,to_seen_at,processed_count,status) VALUES (?,?,?,?,?,?,?)",
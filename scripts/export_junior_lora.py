@@ -4,41 +4,53 @@ Input: history_tail, user_text, neuro_snapshot, env_brief
 Output: intent, tools_hint, rag_query?, style_directive, neuro_update.levels
 """
 
-import json
 from pathlib import Path
 from app.memory.db import get_conn
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+
+    _dumps = orjson.dumps  # returns bytes
+except Exception:  # pragma: no cover - optional dependency
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 def export_junior_lora(path: str = "data/junior_lora.jsonl"):
+    Path("data").mkdir(exist_ok=True)
+    count = 0
     with get_conn() as c:
+        # Iterate the cursor lazily with positional unpacking: no fetchall
+        # copy and no throwaway dict per row.
         cur = c.execute(
             "SELECT m1.text as user_text, m2.text as reply, m2.approved as approved "
             "FROM messages m1 JOIN messages m2 ON m2.id=m1.id+1 "
             "WHERE m1.role='user' AND m2.role='assistant' AND m2.approved=1"
         )
-        rows = [dict(r) for r in cur.fetchall()]
-
-    Path("data").mkdir(exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for r in rows:
-            # here we fake junior_json for demo; replace with real logs
-            sample = {
-                "input": {
-                    "history_tail": [],
-                    "user_text": r["user_text"],
-                    "neuro_snapshot": {"dopamine": 7, "serotonin": 5},
-                    "env_brief": {},
-                },
-                "output": {
-                    "intent": "task",
-                    "tools_hint": ["note.create"],
-                    "rag_query": None,
-                    "style_directive": "тёплый, поддерживающий тон",
-                    "neuro_update": {"levels": {"dopamine": 8, "serotonin": 6}},
-                },
-            }
-            f.write(json.dumps(sample, ensure_ascii=False) + "\n")
-    print(f"Exported {len(rows)} samples to {path}")
+        with open(path, "wb") as f:
+            for user_text, _reply, _approved in cur:
+                # here we fake junior_json for demo; replace with real logs
+                sample = {
+                    "input": {
+                        "history_tail": [],
+                        "user_text": user_text,
+                        "neuro_snapshot": {"dopamine": 7, "serotonin": 5},
+                        "env_brief": {},
+                    },
+                    "output": {
+                        "intent": "task",
+                        "tools_hint": ["note.create"],
+                        "rag_query": None,
+                        "style_directive": "тёплый, поддерживающий тон",
+                        "neuro_update": {"levels": {"dopamine": 8, "serotonin": 6}},
+                    },
+                }
+                f.write(_dumps(sample))
+                f.write(b"\n")
+                count += 1
+    print(f"Exported {count} samples to {path}")
 
 
 if __name__ == "__main__":
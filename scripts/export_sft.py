@@ -2,24 +2,35 @@
 Export approved assistant replies to SFT staging JSONL.
 """
 
-import json
 from pathlib import Path
 
 from app.memory.db import get_conn
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+
+    _dumps = orjson.dumps  # returns bytes
+except Exception:  # pragma: no cover - optional dependency
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 
 def export_sft(path: str = "data/sft_staging.jsonl"):
     with get_conn() as c:
         cur = c.execute(
             "SELECT text FROM messages WHERE role='assistant' AND approved=1 ORDER BY id"
         )
-        rows = [dict(r) for r in cur.fetchall()]
+        texts = [r["text"] for r in cur.fetchall()]
     Path("data").mkdir(exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for r in rows:
-            rec = {"prompt": "", "completion": r["text"]}
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
-    print(f"Exported {len(rows)} replies to {path}")
+    # Build all lines first and write once: a single bytes join and one
+    # buffered write instead of a write call per row.
+    lines = [_dumps({"prompt": "", "completion": t}) for t in texts]
+    with open(path, "wb") as f:
+        if lines:
+            f.write(b"\n".join(lines) + b"\n")
+    print(f"Exported {len(texts)} replies to {path}")
 
 
 if __name__ == "__main__":
@@ -1,32 +1,43 @@
+import asyncio
 import time
 import random
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from app.core.orchestrator import handle_user
 from app.memory.db import migrate
 
+try:  # pragma: no cover - optional dependency
+    import uvloop
+except Exception:  # pragma: no cover - optional dependency
+    uvloop = None
 
-def _one(i: int) -> float:
-    user_id = 1
-    texts = [
-        "сохрани в заметки: небо красное",
-        "сделай напоминание через 2 минуты с текстом 'попить воды'",
-        "поищи, о чём мы говорили сегодня",
-        "привет, как дела?",
-    ]
-    t = random.choice(texts)
-    t0 = time.perf_counter()
-    _ = handle_user(user_id, t, channel="cli", chat_id="local")
-    return time.perf_counter() - t0
+_TEXTS = (
+    "сохрани в заметки: небо красное",
+    "сделай напоминание через 2 минуты с текстом 'попить воды'",
+    "поищи, о чём мы говорили сегодня",
+    "привет, как дела?",
+)
+
+
+async def _one(sem: asyncio.Semaphore) -> float:
+    # handle_user is synchronous, so it runs in the default executor; the
+    # semaphore caps in-flight calls without a dedicated thread pool object.
+    async with sem:
+        t = random.choice(_TEXTS)
+        t0 = time.perf_counter()
+        await asyncio.to_thread(handle_user, 1, t, channel="cli", chat_id="local")
+        return time.perf_counter() - t0
+
+
+async def _run(concurrency: int, total: int) -> list:
+    sem = asyncio.Semaphore(concurrency)
+    return list(await asyncio.gather(*(_one(sem) for _ in range(total))))
 
 
 def main(concurrency: int = 8, total: int = 50) -> None:
     migrate()
-    latencies = []
-    with ThreadPoolExecutor(max_workers=concurrency) as executor:
-        futures = [executor.submit(_one, i) for i in range(total)]
-        for future in as_completed(futures):
-            latencies.append(future.result())
+    if uvloop is not None:  # pragma: no cover - optional dependency
+        uvloop.install()
+    latencies = asyncio.run(_run(concurrency, total))
 
     if not latencies:
         print("No results")
@@ -1,6 +1,71 @@
+import importlib
+import importlib.util
+import os
 import sys
 from pathlib import Path
+from uuid import uuid4
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+TESTS = Path(__file__).resolve().parent
+for _p in (ROOT, TESTS):
+    if str(_p) not in sys.path:
+        sys.path.insert(0, str(_p))
+
+# Single injection point for the YAML fallback: if PyYAML is absent, the
+# test stub is registered exactly once instead of per importing module.
+if importlib.util.find_spec("yaml") is None:
+    sys.modules.setdefault("yaml", importlib.import_module("yaml_stub"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """Import the server module once before the first test runs.
+
+    Route registration, signature caching and model __init__ codegen all
+    happen on this import; doing it here keeps that cost out of whichever
+    test would otherwise hit it first (and out of its timing).
+    """
+
+    importlib.import_module("app.server.main")
+
+
+def mem_db_path() -> str:
+    """A unique shared-cache in-memory sqlite URI; get_conn() parses "file:"
+    paths in URI mode, so tests never touch the filesystem or WAL.
+
+    The xdist worker id is baked into the name so parallel workers are
+    disjoint by construction (in-memory DBs are per-process anyway, but the
+    tag keeps names debuggable and collision-proof under -n auto).
+    """
+
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    return f"file:mem_{worker}_{uuid4().hex}?mode=memory&cache=shared"
+
+
+@pytest.fixture
+def fresh_db(monkeypatch):
+    """Give the test its own migrated in-memory DB."""
+
+    from app.memory import db
+
+    path = mem_db_path()
+    monkeypatch.setattr(db, "DB_PATH", path)
+    db.migrate()
+    return path
+
+
+@pytest.fixture(scope="session")
+def chat_client(tmp_path_factory):
+    """One TestClient (and one startup migration) for the whole session."""
+
+    from fastapi.testclient import TestClient
+
+    from app.memory import db
+    from app.server.main import app
+
+    # Point the startup migration at a session in-memory DB before the client
+    # boots, so nothing lands in the working directory.
+    db.DB_PATH = mem_db_path()
+    return TestClient(app)
@@ -1,7 +1,7 @@
 from app.core.bandit import pick, update
 
 
-def test_bandit_pick_and_update():
+def test_bandit_pick_and_update(fresh_db):
     sug = [{"kind": "good", "confidence": 0.9}, {"kind": "mischief", "confidence": 0.2}]
     chosen = pick("task", sug)
     assert chosen["kind"] in ("good", "mischief")
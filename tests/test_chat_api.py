@@ -0,0 +1,17 @@
+from app.memory import db
+
+# Frozen at module scope: the serialized body never changes between runs.
+CHAT_BODY = {"user_id": "u1", "text": "hello"}
+
+
+def test_chat_endpoint_stub(chat_client, monkeypatch, tmp_path):
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "arkestra.db")
+    monkeypatch.setattr(
+        "app.server.main.handle_user",
+        lambda user_id, text: {"text": f"echo: {text}", "user_id": user_id},
+    )
+
+    r = chat_client.post("/chat", json=CHAT_BODY)
+    assert r.status_code == 200
+    assert r.json()["text"] == "echo: hello"
+    assert r.json()["user_id"] == "u1"
@@ -1,32 +1,39 @@
+import pytest
+
 from app.core.orchestrator import handle_user
 import app.core.llm as llm
 from app.core import tools_runner
-from app.memory import db
 from tests.mock_llm import junior_mock, senior_mock
 
 
-def test_orchestrator_e2e(monkeypatch, tmp_path):
-    test_db = tmp_path / "arkestra.db"
-    monkeypatch.setattr(db, "DB_PATH", test_db)
-    db.migrate()
+def _mock_generate(role, prompt, **kw):
+    return (
+        junior_mock(role, prompt, **kw)
+        if role == "junior"
+        else senior_mock(role, prompt, **kw)
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_llm():
+    """Patch the LLM entry points once per module, not per test."""
 
-    def _mock_generate(role, prompt, **kw):
-        return (
-            junior_mock(role, prompt, **kw)
-            if role == "junior"
-            else senior_mock(role, prompt, **kw)
-        )
+    mp = pytest.MonkeyPatch()
+    mp.setattr(llm, "generate", _mock_generate)
+    mp.setattr("app.agents.junior.llm_generate", _mock_generate)
+    mp.setattr("app.agents.senior.llm_generate", _mock_generate)
+    yield _mock_generate
+    mp.undo()
 
-    monkeypatch.setattr(llm, "generate", _mock_generate)
-    monkeypatch.setattr("app.agents.junior.llm_generate", _mock_generate)
-    monkeypatch.setattr("app.agents.senior.llm_generate", _mock_generate)
 
+def test_orchestrator_e2e(monkeypatch, mock_llm, fresh_db):
     monkeypatch.setattr(
         tools_runner,
         "run_all",
+        # `or ()` / `or {}` avoid allocating default containers per call.
         lambda calls: [
-            {"name": call["name"], "result": {"ok": True, **call.get("args", {})}}
-            for call in (calls or [])
+            {"name": c["name"], "result": {"ok": True, **(c.get("args") or {})}}
+            for c in calls or ()
         ],
     )
 
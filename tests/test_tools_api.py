@@ -0,0 +1,81 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.memory import db
+from app.server.main import app
+
+
+@pytest.fixture(scope="module")
+def _tools_client():
+    """One TestClient (startup + route table) for the whole module."""
+
+    from tests.conftest import mem_db_path
+
+    db.DB_PATH = mem_db_path()
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def client(_tools_client):
+    # Wipe rows instead of recreating the schema between tests.
+    with db.get_conn() as c:
+        c.execute("DELETE FROM tools")
+    return _tools_client
+
+
+def test_tools_crud(client):
+
+    tool = {
+        "name": "note.create",
+        "title": "Заметка",
+        "description": "сохранить заметку",
+        "instruction": "вызывай с аргументом text",
+        "entrypoint": "app.tools.note:main",
+        "enabled": True,
+    }
+    r = client.post("/tools", json=tool)
+    assert r.status_code == 201
+    assert r.json()["name"] == "note.create"
+
+    r = client.post("/tools", json=tool)
+    assert r.status_code == 409
+
+    r = client.get("/tools")
+    assert r.status_code == 200
+    assert [t["name"] for t in r.json()] == ["note.create"]
+
+    r = client.put("/tools/note.create", json={"title": "Новая заметка"})
+    assert r.status_code == 200
+    assert r.json()["title"] == "Новая заметка"
+
+    # Unknown keys must never reach the UPDATE column list.
+    r = client.put("/tools/note.create", json={"title": "Ещё", "junk": 1})
+    assert r.status_code == 200
+    assert r.json()["title"] == "Ещё"
+
+    r = client.put("/tools/note.create", json={"junk": 1})
+    assert r.status_code == 400
+
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert "arkestra_requests_total" in r.json()
+
+    r = client.delete("/tools/note.create")
+    assert r.status_code == 200
+    r = client.get("/tools/note.create")
+    assert r.status_code == 404
+
+
+def test_tools_bulk_upsert(client):
+
+    tools = [
+        {"name": "alias.add", "title": "Алиас", "entrypoint": "app.tools.alias:add"},
+        {"name": "note.create", "title": "Заметка", "entrypoint": "app.tools.note:main"},
+    ]
+    r = client.post("/tools/bulk", json=tools)
+    assert r.status_code == 201
+    assert r.json() == {"ok": True, "count": 2}
+
+    r = client.get("/tools")
+    assert [t["name"] for t in r.json()] == ["alias.add", "note.create"]
